@@ -1,10 +1,20 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io.json as pio_json
+from collections import deque
 from datetime import datetime
+import functools
+import itertools
 import json
 
+# Serialize Plotly figures with orjson instead of the stdlib encoder
+pio_json.config.default_engine = "orjson"
+
+# Charts with more points than this are drawn with WebGL instead of SVG
+_WEBGL_THRESHOLD = 50
+
 # Page configuration
 st.set_page_config(
     page_title="Cloud Billing Calculator",
@@ -14,7 +24,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+_CSS = """
 <style>
 .main-header {
     font-size: 3rem;
@@ -49,132 +59,181 @@ st.markdown("""
     margin: 0.3rem 0;
 }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-def load_config():
-    """Load pricing configuration for different cloud resources."""
-    config = {
-        "currency": "₹",
-        "resources": {
-            "vm": {
-                "name": "Virtual Machine",
-                "rate": 3.50,
-                "unit": "hours",
-                "description": "Standard VM instance",
-                "icon": "🖥️"
-            },
-            "database": {
-                "name": "Database",
-                "rate": 5.25,
-                "unit": "hours",
-                "description": "Managed database service",
-                "icon": "🗄️"
-            },
-            "storage": {
-                "name": "Storage",
-                "rate": 0.08,
-                "unit": "GB-hours",
-                "description": "Block storage",
-                "icon": "💾"
-            },
-            "cdn": {
-                "name": "CDN",
-                "rate": 0.12,
-                "unit": "GB transferred",
-                "description": "Content Delivery Network",
-                "icon": "🌐"
-            },
-            "load_balancer": {
-                "name": "Load Balancer",
-                "rate": 2.80,
-                "unit": "hours",
-                "description": "Application load balancer",
-                "icon": "⚖️"
-            },
-            "lambda": {
-                "name": "Serverless Functions",
-                "rate": 0.000021,
-                "unit": "requests",
-                "description": "Pay per request",
-                "icon": "⚡"
-            },
-            "api_gateway": {
-                "name": "API Gateway",
-                "rate": 0.0035,
-                "unit": "API calls",
-                "description": "API management service",
-                "icon": "🔌"
-            },
-            "monitoring": {
-                "name": "Monitoring",
-                "rate": 1.20,
-                "unit": "hours",
-                "description": "Infrastructure monitoring",
-                "icon": "📊"
-            }
+# Pricing configuration for different cloud resources
+_CONFIG = {
+    "currency": "₹",
+    "resources": {
+        "vm": {
+            "name": "Virtual Machine",
+            "rate": 3.50,
+            "unit": "hours",
+            "description": "Standard VM instance",
+            "icon": "🖥️"
+        },
+        "database": {
+            "name": "Database",
+            "rate": 5.25,
+            "unit": "hours",
+            "description": "Managed database service",
+            "icon": "🗄️"
+        },
+        "storage": {
+            "name": "Storage",
+            "rate": 0.08,
+            "unit": "GB-hours",
+            "description": "Block storage",
+            "icon": "💾"
+        },
+        "cdn": {
+            "name": "CDN",
+            "rate": 0.12,
+            "unit": "GB transferred",
+            "description": "Content Delivery Network",
+            "icon": "🌐"
+        },
+        "load_balancer": {
+            "name": "Load Balancer",
+            "rate": 2.80,
+            "unit": "hours",
+            "description": "Application load balancer",
+            "icon": "⚖️"
+        },
+        "lambda": {
+            "name": "Serverless Functions",
+            "rate": 0.000021,
+            "unit": "requests",
+            "description": "Pay per request",
+            "icon": "⚡"
+        },
+        "api_gateway": {
+            "name": "API Gateway",
+            "rate": 0.0035,
+            "unit": "API calls",
+            "description": "API management service",
+            "icon": "🔌"
+        },
+        "monitoring": {
+            "name": "Monitoring",
+            "rate": 1.20,
+            "unit": "hours",
+            "description": "Infrastructure monitoring",
+            "icon": "📊"
         }
     }
-    return config
+}
+
+# Resource keys and display labels for the selection widgets
+_RESOURCE_KEYS = list(_CONFIG["resources"].keys())
+_RESOURCE_LABELS = {key: f"{res['icon']} {res['name']}" for key, res in _CONFIG["resources"].items()}
+
+# Column-oriented view of the resource catalog for vectorized lookups
+_RES_DF = pd.DataFrame.from_dict(_CONFIG["resources"], orient="index")
+
+# Resource-specific optimization tips
+_TIPS = {
+    "vm": [
+        "💡 Use spot instances for non-critical workloads (up to 90% savings)",
+        "⏰ Schedule VMs to shut down during off-hours",
+        "📊 Right-size instances based on actual usage patterns"
+    ],
+    "database": [
+        "📚 Use read replicas for read-heavy workloads",
+        "🔄 Consider serverless database options for variable workloads",
+        "🗜️ Enable automatic scaling based on demand"
+    ],
+    "storage": [
+        "📦 Archive old data to cheaper storage tiers",
+        "🗜️ Enable compression and deduplication",
+        "🔄 Implement lifecycle policies for automated management"
+    ],
+    "cdn": [
+        "🌍 Optimize cache settings to reduce origin requests",
+        "🗜️ Enable compression for text-based content",
+        "📊 Monitor cache hit ratios and optimize accordingly"
+    ],
+    "load_balancer": [
+        "⚖️ Use application-aware load balancing",
+        "🔄 Implement health checks to avoid unhealthy instances",
+        "📊 Monitor request patterns for optimal scaling"
+    ],
+    "lambda": [
+        "⚡ Optimize function memory allocation",
+        "🔄 Use provisioned concurrency for consistent performance",
+        "📊 Monitor function duration and optimize code"
+    ],
+    "api_gateway": [
+        "🚀 Implement caching to reduce backend calls",
+        "🔐 Use API keys and throttling effectively",
+        "📊 Monitor API usage patterns"
+    ],
+    "monitoring": [
+        "📊 Use custom metrics only when necessary",
+        "⏰ Adjust log retention periods appropriately",
+        "🔍 Focus monitoring on critical business metrics"
+    ]
+}
+
+_GENERAL_TIPS = [
+    "💰 Set up billing alerts to avoid surprises",
+    "📈 Use reserved instances for predictable workloads",
+    "🎯 Implement auto-scaling to match demand"
+]
+
+def load_config():
+    """Load pricing configuration for different cloud resources."""
+    return _CONFIG
 
 def calculate_cost(usage, rate):
     """Calculate the total cost and round to 2 decimal places."""
     return round(usage * rate, 2)
 
-def get_optimization_tips(resource_key, cost):
-    """Get optimization tips based on resource type."""
-    tips = {
-        "vm": [
-            "💡 Use spot instances for non-critical workloads (up to 90% savings)",
-            "⏰ Schedule VMs to shut down during off-hours",
-            "📊 Right-size instances based on actual usage patterns"
-        ],
-        "database": [
-            "📚 Use read replicas for read-heavy workloads",
-            "🔄 Consider serverless database options for variable workloads",
-            "🗜️ Enable automatic scaling based on demand"
-        ],
-        "storage": [
-            "📦 Archive old data to cheaper storage tiers",
-            "🗜️ Enable compression and deduplication",
-            "🔄 Implement lifecycle policies for automated management"
-        ],
-        "cdn": [
-            "🌍 Optimize cache settings to reduce origin requests",
-            "🗜️ Enable compression for text-based content",
-            "📊 Monitor cache hit ratios and optimize accordingly"
-        ],
-        "load_balancer": [
-            "⚖️ Use application-aware load balancing",
-            "🔄 Implement health checks to avoid unhealthy instances",
-            "📊 Monitor request patterns for optimal scaling"
-        ],
-        "lambda": [
-            "⚡ Optimize function memory allocation",
-            "🔄 Use provisioned concurrency for consistent performance",
-            "📊 Monitor function duration and optimize code"
-        ],
-        "api_gateway": [
-            "🚀 Implement caching to reduce backend calls",
-            "🔐 Use API keys and throttling effectively",
-            "📊 Monitor API usage patterns"
-        ],
-        "monitoring": [
-            "📊 Use custom metrics only when necessary",
-            "⏰ Adjust log retention periods appropriately",
-            "🔍 Focus monitoring on critical business metrics"
-        ]
-    }
+def calculate_costs(usages, rates):
+    """Calculate costs for an array of usages and round to 2 decimal places.
+
+    Rounds exactly like ``calculate_cost``: the exact binary value of each
+    product is rounded, with ties going to even. ``np.round`` alone scales by
+    100 first and can round the wrong way near a half-cent.
+    """
+    costs = np.asarray(usages, dtype=np.float64) * rates
     
-    general_tips = [
-        "💰 Set up billing alerts to avoid surprises",
-        "📈 Use reserved instances for predictable workloads",
-        "🎯 Implement auto-scaling to match demand"
-    ]
+    # Non-finite and huge values produce garbage here and are replaced below
+    with np.errstate(over='ignore', invalid='ignore'):
+        # Split costs * 100 into hi + lo exactly (Dekker's product; 100 needs no split)
+        hi = costs * 100
+        split = costs * 134217729.0
+        costs_hi = split - (split - costs)
+        lo = (costs_hi * 100 - hi) + (costs - costs_hi) * 100
+        
+        # rint picks the right integer unless hi sits on a tie that lo breaks
+        cents = np.rint(hi)
+        cents = np.where((hi - cents == 0.5) & (lo > 0), cents + 1, cents)
+        cents = np.where((hi - cents == -0.5) & (lo < 0), cents - 1, cents)
+        result = cents / 100
     
-    resource_tips = tips.get(resource_key, [])
-    return resource_tips + general_tips[:2]
+    # Values too large or non-finite for the split go through round() itself
+    slow = ~np.isfinite(hi) | (np.abs(hi) >= 2.0 ** 52)
+    if slow.any():
+        rounded = np.asarray(np.frompyfunc(round, 2, 1)(costs, 2), dtype=np.float64)
+        result = np.where(slow, rounded, result)
+    return result
+
+@functools.lru_cache(maxsize=16)
+def _get_tips_cached(resource_key):
+    """Build the tips for a resource type, followed by the first two general tips."""
+    return tuple(_TIPS.get(resource_key, ())) + tuple(_GENERAL_TIPS[:2])
+
+def get_optimization_tips(resource_key, cost):
+    """Get optimization tips based on resource type.
+
+    The tips depend only on the resource type; ``cost`` is currently unused.
+    """
+    return _get_tips_cached(resource_key)
 
 def main():
+    st.markdown(_CSS, unsafe_allow_html=True)
+
     # Header
     st.markdown('<h1 class="main-header">☁️ Cloud Billing Calculator</h1>', unsafe_allow_html=True)
     
@@ -193,47 +252,28 @@ def main():
     
     # Initialize session state
     if 'calculations' not in st.session_state:
-        st.session_state.calculations = []
+        st.session_state.calculations = deque(maxlen=5)
     
     # Main content based on mode
     if calc_mode == "Single Resource":
-        single_resource_calculator(config, currency)
+        single_resource_calculator(currency)
     elif calc_mode == "Multiple Resources":
-        multiple_resource_calculator(config, currency)
+        multiple_resource_calculator(currency)
     else:
-        resource_comparison(config, currency)
+        resource_comparison(currency)
     
     # Calculation history
     if st.session_state.calculations:
         st.sidebar.markdown("---")
         st.sidebar.subheader("📝 Recent Calculations")
-        for i, calc in enumerate(reversed(st.session_state.calculations[-5:])):
-            st.sidebar.write(f"**{calc['resource']}**: {currency}{calc['cost']:.2f}")
+        st.sidebar.markdown("\n".join(
+            f"- **{calc['resource']}**: {currency}{calc['cost']:.2f}"
+            for calc in reversed(st.session_state.calculations)
+        ))
 
-def single_resource_calculator(config, currency):
-    st.subheader("🎯 Single Resource Calculator")
-    
-    # Resource selection
-    col1, col2 = st.columns([1, 2])
-    
-    with col1:
-        selected_resource = st.selectbox(
-            "Select Cloud Resource",
-            list(config["resources"].keys()),
-            format_func=lambda x: f"{config['resources'][x]['icon']} {config['resources'][x]['name']}"
-        )
-    
-    resource = config["resources"][selected_resource]
-    
-    with col2:
-        st.markdown(f"""
-        <div class="resource-card">
-            <h4>{resource['icon']} {resource['name']}</h4>
-            <p><strong>Description:</strong> {resource['description']}</p>
-            <p><strong>Rate:</strong> {currency}{resource['rate']} per {resource['unit']}</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
+@st.fragment
+def _cost_block(resource, currency, selected_resource):
+    """Render the usage input, cost breakdown and tips in their own fragment."""
     # Usage input
     st.markdown("### 📊 Usage Input")
     usage = st.number_input(
@@ -268,124 +308,179 @@ def single_resource_calculator(config, currency):
         # Save calculation
         if st.button("💾 Save Calculation"):
             st.session_state.calculations.append({
-                'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                'timestamp': datetime.now().isoformat(sep=' ', timespec='seconds'),
                 'resource': resource['name'],
                 'usage': usage,
                 'unit': resource['unit'],
                 'rate': resource['rate'],
                 'cost': cost
             })
+            st.session_state.calculation_saved = True
+            # Rerun the whole app so the sidebar history shows the new entry
+            st.rerun()
+        if st.session_state.pop('calculation_saved', False):
             st.success("Calculation saved!")
         
         # Optimization tips
         st.markdown("### 💡 Optimization Tips")
         tips = get_optimization_tips(selected_resource, cost)
-        for tip in tips:
-            st.markdown(f'<div class="optimization-tip">{tip}</div>', unsafe_allow_html=True)
+        st.markdown(
+            "".join(f'<div class="optimization-tip">{tip}</div>' for tip in tips),
+            unsafe_allow_html=True
+        )
+
+def single_resource_calculator(currency):
+    st.subheader("🎯 Single Resource Calculator")
+    
+    # Resource selection
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        selected_resource = st.selectbox(
+            "Select Cloud Resource",
+            _RESOURCE_KEYS,
+            format_func=_RESOURCE_LABELS.__getitem__
+        )
+    
+    resource = _CONFIG["resources"][selected_resource]
+    
+    with col2:
+        st.markdown(f"""
+        <div class="resource-card">
+            <h4>{resource['icon']} {resource['name']}</h4>
+            <p><strong>Description:</strong> {resource['description']}</p>
+            <p><strong>Rate:</strong> {currency}{resource['rate']} per {resource['unit']}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    _cost_block(resource, currency, selected_resource)
+
+@st.fragment
+def _render_charts(labels, names, costs, currency):
+    """Render the cost breakdown charts behind a toggle in their own fragment.
 
-def multiple_resource_calculator(config, currency):
+    Flipping the toggle reruns only this fragment; while it is off, reruns
+    of the page skip building and serializing the figures.
+    """
+    st.markdown("### 📊 Cost Breakdown")
+    
+    if not st.toggle("Show breakdown charts", key="show_breakdown_charts"):
+        return
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Pie chart
+        fig_pie = go.Figure(go.Pie(values=costs, labels=labels))
+        fig_pie.update_layout(title="Cost Distribution")
+        st.plotly_chart(fig_pie, use_container_width=True)
+    
+    with col2:
+        # Bar chart
+        fig_bar = go.Figure(go.Bar(x=names, y=costs))
+        fig_bar.update_layout(
+            title="Cost by Resource",
+            xaxis_title="Resource",
+            yaxis_title=f"Cost ({currency})"
+        )
+        st.plotly_chart(fig_bar, use_container_width=True)
+
+def multiple_resource_calculator(currency):
     st.subheader("📊 Multiple Resources Calculator")
     
     # Resource selection
     selected_resources = st.multiselect(
         "Select Cloud Resources",
-        list(config["resources"].keys()),
-        format_func=lambda x: f"{config['resources'][x]['icon']} {config['resources'][x]['name']}"
+        _RESOURCE_KEYS,
+        format_func=_RESOURCE_LABELS.__getitem__
     )
     
     if not selected_resources:
         st.info("👆 Please select one or more resources to calculate costs")
         return
     
+    # Resource columns shared by the inputs, table and charts
+    subset = _RES_DF.loc[selected_resources]
+    names = subset['name'].to_numpy()
+    labels = (subset['icon'] + ' ' + subset['name']).to_numpy()
+    units = subset['unit'].to_numpy()
+    rates = subset['rate'].to_numpy(dtype=np.float64)
+    
     # Usage inputs
     st.markdown("### 📊 Usage Inputs")
-    usage_data = {}
+    usages = np.empty(len(selected_resources), dtype=np.float64)
+    cost_slots = []
     
-    cols = st.columns(min(len(selected_resources), 3))
+    col_cycle = itertools.cycle(st.columns(min(len(selected_resources), 3)))
     
     for i, resource_key in enumerate(selected_resources):
-        resource = config["resources"][resource_key]
-        col_idx = i % 3
-        
-        with cols[col_idx]:
-            st.markdown(f"**{resource['icon']} {resource['name']}**")
-            usage = st.number_input(
-                f"Usage ({resource['unit']})",
+        with next(col_cycle):
+            st.markdown(f"**{labels[i]}**")
+            usages[i] = st.number_input(
+                f"Usage ({units[i]})",
                 min_value=0.0,
                 value=0.0,
                 step=0.1,
                 key=f"usage_{resource_key}"
             )
-            
-            if usage > 0:
-                cost = calculate_cost(usage, resource['rate'])
-                usage_data[resource_key] = {
-                    'name': resource['name'],
-                    'icon': resource['icon'],
-                    'usage': usage,
-                    'unit': resource['unit'],
-                    'rate': resource['rate'],
-                    'cost': cost
-                }
-                st.write(f"Cost: {currency}{cost:.2f}")
+            cost_slots.append(st.empty())
+    
+    # Cost every selected resource in one pass, then keep the ones in use
+    costs = calculate_costs(usages, rates)
+    mask = usages > 0
+    
+    for slot, cost, used in zip(cost_slots, costs, mask):
+        if used:
+            slot.write(f"Cost: {currency}{cost:.2f}")
     
     # Results
-    if usage_data:
+    if mask.any():
         st.markdown("### 💰 Cost Summary")
         
+        used_labels = labels[mask]
+        used_usages = usages[mask]
+        used_units = units[mask]
+        used_rates = rates[mask]
+        used_costs = costs[mask]
+        
         # Calculate total
-        total_cost = sum(item['cost'] for item in usage_data.values())
+        total_cost = float(used_costs.sum())
+        percentages = used_costs / total_cost * 100
         
         # Summary metrics
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Resources Used", len(usage_data))
-        with col2:
-            st.metric("Total Cost", f"{currency}{total_cost:.2f}")
-        with col3:
-            avg_cost = total_cost / len(usage_data)
-            st.metric("Average per Resource", f"{currency}{avg_cost:.2f}")
+        summary = pd.DataFrame([{
+            "Resources Used": len(used_costs),
+            "Total Cost": total_cost,
+            "Average per Resource": total_cost / len(used_costs)
+        }])
+        money = f"{currency}{{:.2f}}"
+        st.dataframe(
+            summary.style.format({"Total Cost": money, "Average per Resource": money}),
+            hide_index=True,
+            use_container_width=True
+        )
         
         # Detailed table
-        df_data = []
-        for key, item in usage_data.items():
-            percentage = (item['cost'] / total_cost) * 100
-            df_data.append({
-                'Resource': f"{item['icon']} {item['name']}",
-                'Usage': f"{item['usage']} {item['unit']}",
-                'Rate': f"{currency}{item['rate']}",
-                'Cost': f"{currency}{item['cost']:.2f}",
-                'Percentage': f"{percentage:.1f}%"
-            })
-        
-        df = pd.DataFrame(df_data)
+        df = pd.DataFrame({
+            'Resource': used_labels,
+            'Usage': used_usages,
+            'Unit': used_units,
+            'Rate': used_rates,
+            'Cost': used_costs,
+            'Percentage': percentages
+        })
+        df = df.assign(
+            Usage=df['Usage'].astype(str) + ' ' + df['Unit'],
+            Rate=currency + df['Rate'].astype(str),
+            Cost=currency + df['Cost'].map('{:.2f}'.format),
+            Percentage=df['Percentage'].map('{:.1f}%'.format)
+        ).drop(columns='Unit')
         st.dataframe(df, use_container_width=True)
         
         # Cost breakdown chart
-        st.markdown("### 📊 Cost Breakdown")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Pie chart
-            fig_pie = px.pie(
-                values=[item['cost'] for item in usage_data.values()],
-                names=[f"{item['icon']} {item['name']}" for item in usage_data.values()],
-                title="Cost Distribution"
-            )
-            st.plotly_chart(fig_pie, use_container_width=True)
-        
-        with col2:
-            # Bar chart
-            fig_bar = px.bar(
-                x=[item['name'] for item in usage_data.values()],
-                y=[item['cost'] for item in usage_data.values()],
-                title="Cost by Resource",
-                labels={'x': 'Resource', 'y': f'Cost ({currency})'}
-            )
-            st.plotly_chart(fig_bar, use_container_width=True)
+        _render_charts(used_labels, names[mask], used_costs, currency)
 
-def resource_comparison(config, currency):
+def resource_comparison(currency):
     st.subheader("🔍 Resource Comparison")
     
     st.info("Compare costs across different usage scenarios")
@@ -393,8 +488,8 @@ def resource_comparison(config, currency):
     # Select resources to compare
     resources_to_compare = st.multiselect(
         "Select resources to compare",
-        list(config["resources"].keys()),
-        format_func=lambda x: f"{config['resources'][x]['icon']} {config['resources'][x]['name']}"
+        _RESOURCE_KEYS,
+        format_func=_RESOURCE_LABELS.__getitem__
     )
     
     if len(resources_to_compare) < 2:
@@ -405,62 +500,71 @@ def resource_comparison(config, currency):
     st.markdown("### 📊 Usage Scenarios")
     scenario_name = st.text_input("Scenario Name", "Production Workload")
     
+    # Resource columns shared by the inputs, table and chart
+    subset = _RES_DF.loc[resources_to_compare]
+    labels = (subset['icon'] + ' ' + subset['name']).tolist()
+    units = subset['unit'].to_numpy()
+    rates = subset['rate'].to_numpy(dtype=np.float64)
+    
     # Create comparison data
-    comparison_data = []
+    usages = np.empty(len(resources_to_compare), dtype=np.float64)
     
-    cols = st.columns(min(len(resources_to_compare), 3))
+    col_cycle = itertools.cycle(st.columns(min(len(resources_to_compare), 3)))
     
     for i, resource_key in enumerate(resources_to_compare):
-        resource = config["resources"][resource_key]
-        col_idx = i % 3
-        
-        with cols[col_idx]:
-            st.markdown(f"**{resource['icon']} {resource['name']}**")
-            st.write(f"Rate: {currency}{resource['rate']} per {resource['unit']}")
+        with next(col_cycle):
+            st.markdown(f"**{labels[i]}**")
+            st.write(f"Rate: {currency}{rates[i]} per {units[i]}")
             
-            usage = st.number_input(
-                f"Usage ({resource['unit']})",
+            usages[i] = st.number_input(
+                f"Usage ({units[i]})",
                 min_value=0.0,
                 value=1.0,
                 step=0.1,
                 key=f"compare_{resource_key}"
             )
-            
-            cost = calculate_cost(usage, resource['rate'])
-            comparison_data.append({
-                'Resource': f"{resource['icon']} {resource['name']}",
-                'Usage': f"{usage} {resource['unit']}",
-                'Rate': resource['rate'],
-                'Cost': cost,
-                'Cost per Unit': resource['rate']
-            })
     
-    if comparison_data:
-        # Comparison table
-        df = pd.DataFrame(comparison_data)
-        st.dataframe(df, use_container_width=True)
-        
-        # Comparison chart
-        fig = px.bar(
-            df,
-            x='Resource',
-            y='Cost',
-            title=f"Cost Comparison - {scenario_name}",
-            text='Cost'
+    costs = calculate_costs(usages, rates)
+    
+    # Comparison table
+    df = pd.DataFrame({
+        'Resource': labels,
+        'Usage': usages,
+        'Unit': units,
+        'Rate': rates,
+        'Cost': costs
+    })
+    st.dataframe(df, use_container_width=True)
+    
+    # Comparison chart
+    if len(labels) > _WEBGL_THRESHOLD:
+        trace = go.Scattergl(x=labels, y=costs, mode='markers')
+    else:
+        trace = go.Bar(
+            x=labels,
+            y=costs,
+            text=costs,
+            texttemplate=f'{currency}%{{text:.2f}}',
+            textposition='outside'
         )
-        fig.update_traces(texttemplate=f'{currency}%{{text:.2f}}', textposition='outside')
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Cost efficiency analysis
-        st.markdown("### 📈 Cost Efficiency Analysis")
-        most_expensive = df.loc[df['Cost'].idxmax()]
-        least_expensive = df.loc[df['Cost'].idxmin()]
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            st.error(f"🔴 Most Expensive: {most_expensive['Resource']} - {currency}{most_expensive['Cost']:.2f}")
-        with col2:
-            st.success(f"🟢 Most Economical: {least_expensive['Resource']} - {currency}{least_expensive['Cost']:.2f}")
+    fig = go.Figure(trace)
+    fig.update_layout(
+        title=f"Cost Comparison - {scenario_name}",
+        xaxis_title="Resource",
+        yaxis_title="Cost"
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Cost efficiency analysis
+    st.markdown("### 📈 Cost Efficiency Analysis")
+    i_max = int(costs.argmax())
+    i_min = int(costs.argmin())
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.error(f"🔴 Most Expensive: {labels[i_max]} - {currency}{costs[i_max]:.2f}")
+    with col2:
+        st.success(f"🟢 Most Economical: {labels[i_min]} - {currency}{costs[i_min]:.2f}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
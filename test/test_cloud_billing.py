@@ -150,6 +150,26 @@ class TestCalculationLogic:
         except ImportError:
             pytest.skip("Module not available")
     
+    def test_vectorized_matches_scalar(self):
+        """Test vectorized calculation agrees with the scalar one."""
+        try:
+            from cloud_billing_app import calculate_cost, calculate_costs
+            
+            usages = [0, 1, 3, 12.5, 24.5, 1000000, 0.1, 110.0]
+            rates = [5.0, 0.333, 0.334, 3.0, 3.50, 3.50, 5.25, 0.0035]
+            expected = [0.0, 0.33, 1.0, 37.5, 85.75, 3500000.0, 0.53, 0.39]
+            
+            assert list(calculate_costs(usages, rates)) == expected
+            assert [calculate_cost(u, r) for u, r in zip(usages, rates)] == expected
+            
+            # Products just above a half-cent round up (np.round alone gives 0.52 / 0.38)
+            assert calculate_cost(0.1, 5.25) == 0.53
+            assert calculate_cost(110.0, 0.0035) == 0.39
+            assert list(calculate_costs([0.1, 110.0], [5.25, 0.0035])) == [0.53, 0.39]
+            
+        except ImportError:
+            pytest.skip("Module not available")
+    
     def test_negative_values(self):
         """Test handling of negative values."""
         try:
@@ -204,6 +224,30 @@ class TestPerformance:
             
         except ImportError:
             pytest.skip("Module not available")
+    
+    def test_vectorized_calculation_speed(self):
+        """Test vectorized calculation performance."""
+        import time
+        
+        try:
+            import numpy as np
+            from cloud_billing_app import calculate_costs
+            
+            start_time = time.time()
+            
+            # Perform many calculations in one call
+            costs = calculate_costs(np.arange(10000) * 0.1, 3.5)
+            
+            end_time = time.time()
+            execution_time = end_time - start_time
+            
+            assert len(costs) == 10000
+            assert costs[1] == 0.35
+            assert costs[-1] == round(9999 * 0.1 * 3.5, 2)
+            assert execution_time < 0.1, f"Calculations took too long: {execution_time}s"
+            
+        except ImportError:
+            pytest.skip("Module not available")
 
 # Integration tests
 def test_full_workflow():